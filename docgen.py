@@ -22,33 +22,114 @@ Outputs:
 - docs/report.txt
 """
 
-import argparse, json, os, re, sys, importlib, inspect, pkgutil, textwrap
+import argparse, asyncio, csv, functools, hashlib, io, json, os, re, sys, time, importlib, importlib.util
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait as futures_wait
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, Dict, List, NamedTuple, Tuple, Optional
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
 
+try:
+    import orjson  # optional; several times faster than stdlib json on big specs
+except ImportError:
+    orjson = None
+
+def _loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def _dumps(data: Any) -> bytes:
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
 ROOT = Path(__file__).resolve().parents[1]
 OUT_DIR = ROOT / "docs"
 SCHEMAS_DIR = OUT_DIR / "schemas"
 EXAMPLES_DIR = OUT_DIR / "examples"
+SNAPSHOT_PATH = OUT_DIR / "openapi.snapshot.json"
+CACHE_META_PATH = OUT_DIR / ".cache-meta.json"
+EXAMPLE_HASHES_PATH = OUT_DIR / ".example-hashes.json"
 
 DEFAULT_BASE = "http://localhost:8000"
 OPENAPI_URL = f"{DEFAULT_BASE}/openapi.json"
 
+SKIP_DIRS = {"node_modules", "__pycache__", "venv", ".venv", ".git", ".idea", "build", "dist"}
+
+# match @router.get("/x") / @app.post("/y")
+ROUTE_RE = re.compile(rb'@\w+\.(get|post|put|patch|delete)\(\s*["\']([^"\']+)["\']', re.I)
+ROUTE_TOKENS = (b".get(", b".post(", b".put(", b".patch(", b".delete(")
+
 def _mkdirs():
     OUT_DIR.mkdir(exist_ok=True)
     SCHEMAS_DIR.mkdir(parents=True, exist_ok=True)
     EXAMPLES_DIR.mkdir(parents=True, exist_ok=True)
 
-def fetch_live_openapi(url: str) -> Optional[Dict[str, Any]]:
+def _load_cache_meta() -> Dict[str, Any]:
     try:
-        req = Request(url, headers={"Accept": "application/json"})
+        return json.loads(CACHE_META_PATH.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+
+def _save_cache_meta(meta: Dict[str, Any]):
+    CACHE_META_PATH.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+
+def _load_example_hashes() -> Dict[str, str]:
+    try:
+        return json.loads(EXAMPLE_HASHES_PATH.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+
+def fetch_live_openapi(url: str, meta: Optional[Dict[str, Any]] = None,
+                       _conditional: bool = True) -> Tuple[Optional[Dict[str, Any]], Optional[bytes]]:
+    """Fetch the spec; returns (parsed spec, raw bytes) so callers can
+    reuse the server's serialization instead of re-encoding."""
+    headers = {"Accept": "application/json"}
+    if meta and _conditional:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    try:
+        req = Request(url, headers=headers)
         with urlopen(req, timeout=5) as resp:
-            data = json.load(resp)
-            return data
-    except (URLError, HTTPError, TimeoutError):
-        return None
+            raw = resp.read()
+            if meta is not None:
+                meta["etag"] = resp.headers.get("ETag")
+                meta["last_modified"] = resp.headers.get("Last-Modified")
+                meta["live_digest"] = hashlib.blake2b(raw).hexdigest()
+            return _loads(raw), raw
+    except HTTPError as e:
+        if e.code == 304:
+            # Server says the spec is unchanged. Only trust the snapshot
+            # if it is the live spec that earned these validators; a
+            # fallback run may have overwritten it in between.
+            try:
+                raw = SNAPSHOT_PATH.read_bytes()
+                if hashlib.blake2b(raw).hexdigest() == (meta or {}).get("live_digest"):
+                    return _loads(raw), raw
+            except Exception:
+                pass
+            # Snapshot missing or stale: refetch unconditionally instead
+            # of abandoning the live source.
+            if _conditional:
+                return fetch_live_openapi(url, meta, _conditional=False)
+        return None, None
+    except (URLError, TimeoutError):
+        return None, None
+
+def _openapi_from_module(mod) -> Optional[Dict[str, Any]]:
+    # vars() skips inspect.getmembers' sorting and per-attribute getattr
+    for name, obj in list(vars(mod).items()):
+        if name.startswith("_"):
+            continue
+        # Lazy type check to avoid requiring fastapi import here
+        if type(obj).__name__ == "FastAPI":
+            try:
+                return obj.openapi()
+            except Exception:
+                pass
+    return None
 
 def import_app_and_get_openapi() -> Optional[Dict[str, Any]]:
     """
@@ -65,47 +146,69 @@ def import_app_and_get_openapi() -> Optional[Dict[str, Any]]:
             mod = importlib.import_module(modname)
         except Exception:
             continue
-        # find FastAPI instance
-        for name, obj in inspect.getmembers(mod):
-            # Lazy type check to avoid requiring fastapi import here
-            if obj.__class__.__name__ == "FastAPI":
-                try:
-                    return obj.openapi()
-                except Exception:
-                    pass
-    # Deep scan modules under app/
+        spec = _openapi_from_module(mod)
+        if spec:
+            return spec
+    # Deep scan modules under app/ (pruned walk; never descends into
+    # hidden/build dirs the way pkgutil.walk_packages would)
     app_pkg = ROOT / "app"
     if app_pkg.exists():
         sys.path.insert(0, str(ROOT))
-        for _, modname, _ in pkgutil.walk_packages([str(app_pkg)], prefix="app."):
+        for pyfile in find_py_files(app_pkg):
+            rel = pyfile.relative_to(ROOT).with_suffix("")
+            modname = ".".join(rel.parts)
+            if modname.endswith(".__init__"):
+                modname = modname[: -len(".__init__")]
             try:
+                if importlib.util.find_spec(modname) is None:
+                    continue
                 mod = importlib.import_module(modname)
             except Exception:
                 continue
-            for name, obj in inspect.getmembers(mod):
-                if obj.__class__.__name__ == "FastAPI":
-                    try:
-                        return obj.openapi()
-                    except Exception:
-                        pass
+            spec = _openapi_from_module(mod)
+            if spec:
+                return spec
     return None
 
+def find_py_files(root: Path):
+    """Yield .py file paths under root, pruning hidden/vendored dirs before descent."""
+    stack = deque([str(root)])
+    while stack:
+        dirpath = stack.pop()
+        try:
+            entries = os.scandir(dirpath)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(".") or name in SKIP_DIRS:
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif name.endswith(".py"):
+                        yield Path(entry.path)
+                except OSError:
+                    continue
+
 def static_route_scan() -> Dict[str, Any]:
     """
     Very lightweight fallback: glean routes via decorator strings.
     This is a best-effort heuristic; real completeness comes from OpenAPI.
     """
     routes: Dict[str, Any] = {}
-    for path in ROOT.rglob("*.py"):
-        if path.parts and any(p.startswith('.') for p in path.parts):
-            continue
+    for path in find_py_files(ROOT):
         try:
-            text = path.read_text(encoding="utf-8", errors="ignore")
+            data = path.read_bytes()
         except Exception:
             continue
-        # match @router.get("/x") / @app.post("/y")
-        for m in re.finditer(r'@(?:\w+)\.(get|post|put|patch|delete)\(\s*["\']([^"\']+)["\']', text, flags=re.I):
-            method, route = m.group(1).upper(), m.group(2)
+        # Cheap prefilter: skip files that cannot contain a route decorator.
+        if b"@" not in data or not any(tok in data for tok in ROUTE_TOKENS):
+            continue
+        for m in ROUTE_RE.finditer(data):
+            method = m.group(1).decode("ascii").upper()
+            route = m.group(2).decode("utf-8", errors="ignore")
             routes.setdefault(route, {})
             routes[route].setdefault(method, {"summary": f"Discovered {method} {route} (static scan)", "parameters": []})
     # Build a minimal openapi-ish structure
@@ -123,58 +226,156 @@ def static_route_scan() -> Dict[str, Any]:
         "paths": paths,
     }
 
-def save_json(data: Dict[str, Any], path: Path):
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+def _write_bytes(path: Path, data: bytes):
+    path.write_bytes(data)
+
+def save_json(data: Dict[str, Any], path: Path, pool: Optional[ThreadPoolExecutor] = None, futures: Optional[List] = None):
+    payload = _dumps(data)
+    if pool is not None:
+        futures.append(pool.submit(_write_bytes, path, payload))
+    else:
+        path.write_bytes(payload)
 
+_SANITIZE_RE = re.compile(r"[^a-zA-Z0-9._\-]+")
+
+@functools.lru_cache(maxsize=4096)
 def sanitize_filename(s: str) -> str:
-    return re.sub(r"[^a-zA-Z0-9._\-]+", "_", s)
+    return _SANITIZE_RE.sub("_", s)
 
 def base_url_from_openapi(spec: Dict[str, Any]) -> str:
-    servers = spec.get("servers") or []
-    if servers and isinstance(servers, list) and servers[0].get("url"):
-        return servers[0]["url"].rstrip("/")
+    if (servers := spec.get("servers")) and (url := servers[0].get("url")):
+        return url.rstrip("/")
     return DEFAULT_BASE
 
 def extract_schemas(spec: Dict[str, Any]) -> Dict[str, Any]:
     return (spec.get("components") or {}).get("schemas") or {}
 
 def op_security(op: Dict[str, Any]) -> bool:
-    sec = op.get("security")
-    return bool(sec) and isinstance(sec, list) and len(sec) > 0
+    # per spec, "security" is a list when present; truthiness is enough
+    return bool(op.get("security"))
+
+MAX_EXAMPLE_DEPTH = 6
 
-def example_payload(schema: Dict[str, Any]) -> Any:
-    """Very simple example generator based on types/enums/defaults."""
+def _example_placeholder(schema: Dict[str, Any]) -> Any:
+    """Shallow stand-in used when the walk is cut off (cycle/too deep)."""
+    t = schema.get("type")
+    if t == "string": return "string"
+    if t == "integer": return 0
+    if t == "number": return 0.0
+    if t == "boolean": return True
+    if t == "array": return []
+    if t == "object" or "properties" in schema: return {}
+    return None
+
+def example_payload(schema: Dict[str, Any], _cache: Optional[Dict[int, Any]] = None,
+                    _depth: int = 0, _seen: frozenset = frozenset(),
+                    schemas: Optional[Dict[str, Any]] = None) -> Any:
+    """Very simple example generator based on types/enums/defaults.
+
+    Memoized by schema identity; pass one cache dict per run so shared
+    subschemas are only walked once. $ref pointers are resolved against
+    `schemas` (components.schemas) when provided. Self-referential
+    schemas and nesting beyond MAX_EXAMPLE_DEPTH yield a shallow
+    placeholder instead of recursing forever.
+    """
+    if _cache is None:
+        _cache = {}
+    out, _ = _example_walk(schema, _cache, _depth, _seen, schemas)
+    return out
+
+def _example_walk(schema: Dict[str, Any], _cache: Dict[int, Any], _depth: int, _seen: frozenset,
+                  schemas: Optional[Dict[str, Any]]) -> Tuple[Any, bool]:
+    """Returns (example, truncated). A result is only cached when no part
+    of its subtree was cut off, so shallow callers of a shared schema
+    still get the full example."""
     if not isinstance(schema, dict):
-        return None
+        return None, False
+    key = id(schema)
+    if key in _cache:
+        return _cache[key], False
+    if _depth > MAX_EXAMPLE_DEPTH or key in _seen:
+        return _example_placeholder(schema), True
+    out, truncated = _example_payload(schema, _cache, _depth, _seen | {key}, schemas)
+    if not truncated:
+        _cache[key] = out
+    return out, truncated
+
+def _example_payload(schema: Dict[str, Any], _cache: Dict[int, Any], _depth: int, _seen: frozenset,
+                     schemas: Optional[Dict[str, Any]]) -> Tuple[Any, bool]:
+    if (ref := schema.get("$ref")):
+        # local pointer like #/components/schemas/Foo; one dict lookup
+        name = ref.rsplit("/", 1)[-1]
+        return _example_walk((schemas or {}).get(name, {}), _cache, _depth, _seen, schemas)
     if "example" in schema:
-        return schema["example"]
+        return schema["example"], False
     if "enum" in schema:
-        return schema["enum"][0]
+        return schema["enum"][0], False
     t = schema.get("type")
     if t == "string":
         fmt = schema.get("format")
-        if fmt == "date-time": return "2025-01-01T00:00:00Z"
-        if fmt == "email": return "user@example.com"
-        if fmt == "uuid": return "00000000-0000-0000-0000-000000000000"
-        return schema.get("default", "string")
+        if fmt == "date-time": return "2025-01-01T00:00:00Z", False
+        if fmt == "email": return "user@example.com", False
+        if fmt == "uuid": return "00000000-0000-0000-0000-000000000000", False
+        return schema.get("default", "string"), False
     if t == "integer":
-        return schema.get("default", 123)
+        return schema.get("default", 123), False
     if t == "number":
-        return schema.get("default", 1.23)
+        return schema.get("default", 1.23), False
     if t == "boolean":
-        return schema.get("default", True)
+        return schema.get("default", True), False
     if t == "array":
-        return [example_payload(schema.get("items", {}))]
+        item, truncated = _example_walk(schema.get("items", {}), _cache, _depth + 1, _seen, schemas)
+        return [item], truncated
     if t == "object" or "properties" in schema:
         out = {}
+        truncated = False
         props = schema.get("properties", {})
         req = set(schema.get("required", []))
         for k, v in props.items():
-            out[k] = example_payload(v)
+            out[k], child_truncated = _example_walk(v, _cache, _depth + 1, _seen, schemas)
+            truncated = truncated or child_truncated
             if out[k] is None and k in req:
                 out[k] = "string"
-        return out
-    return schema.get("default", None)
+        return out, truncated
+    return schema.get("default", None), False
+
+class Endpoint(NamedTuple):
+    path: str
+    method: str  # already uppercased
+    op: Dict[str, Any]
+    body_schema: Optional[Dict[str, Any]]
+    body_example: Any
+    needs_auth: bool
+    name: str
+    tags: str
+    summary: str
+    path_segments: List[str]
+
+def collect_endpoints(spec: Dict[str, Any]) -> Tuple[List[Endpoint], Dict[int, Any]]:
+    """Walk spec['paths'] once into Endpoint records; body schema/example/
+    auth are computed here so every emitter shares the results."""
+    cache: Dict[int, Any] = {}
+    schemas = extract_schemas(spec)
+    endpoints: List[Endpoint] = []
+    for path, methods in (spec.get("paths") or {}).items():
+        for method, op in methods.items():
+            mu = method.upper()
+            body_schema = body_schema_from_op(op)
+            body_example = example_payload(body_schema, cache, schemas=schemas) if body_schema else None
+            summary = op.get("summary", "")
+            endpoints.append(Endpoint(
+                path=path,
+                method=mu,
+                op=op,
+                body_schema=body_schema,
+                body_example=body_example,
+                needs_auth=op_security(op),
+                name=summary or f"{mu} {path}",
+                tags=", ".join(op.get("tags", []) or []),
+                summary=summary,
+                path_segments=path.lstrip("/").split("/") if path != "/" else [],
+            ))
+    return endpoints, cache
 
 def body_schema_from_op(op: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     req_body = op.get("requestBody")
@@ -197,6 +398,27 @@ def response_schema_from_op(op: Dict[str, Any]) -> Optional[Dict[str, Any]]:
                 return sch
     return None
 
+# Kept unindented at module scope so code_samples doesn't pay for a
+# textwrap.dedent pass per endpoint.
+_SAMPLE_TMPL = """**curl**
+```bash
+curl -s -X {method} "{url}" {auth}{body_curl}
+```
+
+**HTTPie**
+```bash
+http {method} {url} {auth_stripped}{body_httpie}
+```
+
+**Python (requests)**
+```python
+import requests
+headers = {{"Authorization": "Bearer <token>"}} if {needs_auth} else {{}}
+r = requests.{method_lower}("{url}", headers=headers, {body_py})
+print(r.status_code)
+print(r.json() if "application/json" in r.headers.get("Content-Type","") else r.text)
+```"""
+
 def code_samples(base: str, method: str, path: str, needs_auth: bool, body: Optional[dict]) -> str:
     url = f"{base}{path}"
     auth = '-H "Authorization: Bearer <token>" ' if needs_auth else ""
@@ -205,192 +427,289 @@ def code_samples(base: str, method: str, path: str, needs_auth: bool, body: Opti
     body_httpie = f" Content-Type:application/json <<< '{body_json}'" if body_json else ""
     body_py = f"json={body_json}" if body_json else "params={}" if method == "GET" else "json={}"
 
-    return textwrap.dedent(f"""
-    **curl**
-    ```bash
-    curl -s -X {method} "{url}" {auth}{body_curl}
-    ```
-
-    **HTTPie**
-    ```bash
-    http {method} {url} {auth.strip()}{body_httpie}
-    ```
-
-    **Python (requests)**
-    ```python
-    import requests
-    headers = {{"Authorization": "Bearer <token>"}} if {str(needs_auth)} else {{}}
-    r = requests.{method.lower()}("{url}", headers=headers, {body_py})
-    print(r.status_code)
-    print(r.json() if "application/json" in r.headers.get("Content-Type","") else r.text)
-    ```
-    """).strip()
-
-def write_endpoint_example(path: str, method: str, op: Dict[str, Any], base: str):
-    needs_auth = op_security(op)
-    body_schema = body_schema_from_op(op)
-    body_example = example_payload(body_schema) if body_schema else None
-    code = code_samples(base, method, path, needs_auth, body_example)
-    fname = EXAMPLES_DIR / f"{sanitize_filename(method)}_{sanitize_filename(path)}.md"
-    fname.write_text(code, encoding="utf-8")
+    return _SAMPLE_TMPL.format(
+        method=method, method_lower=method.lower(), url=url,
+        auth=auth, auth_stripped=auth.strip(),
+        body_curl=body_curl, body_httpie=body_httpie, body_py=body_py,
+        needs_auth=needs_auth,
+    )
 
-def generate_postman(spec: Dict[str, Any], base: str) -> Dict[str, Any]:
+def write_endpoint_example(path: str, method: str, body_example: Any, needs_auth: bool, base: str,
+                           pool: Optional[ThreadPoolExecutor] = None, futures: Optional[List] = None,
+                           hashes: Optional[Dict[str, str]] = None):
+    fname = EXAMPLES_DIR / f"{sanitize_filename(method)}_{sanitize_filename(path)}.md"
+    # Cheap change detection: hash the inputs and skip rendering entirely
+    # when this endpoint produced the same file last run.
+    if hashes is not None:
+        hkey = f"{method} {path}"
+        fingerprint = json.dumps([method, path, body_example, needs_auth, base],
+                                 sort_keys=True, default=str)
+        hdigest = hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=16).hexdigest()
+        if hashes.get(hkey) == hdigest and fname.exists():
+            return
+        hashes[hkey] = hdigest
+    code = code_samples(base, method, path, needs_auth, body_example)
+    data = code.encode("utf-8")
+    # Skip the write when the file already holds this exact content.
+    # (No cross-endpoint dedupe: every sample embeds its own URL, so two
+    # endpoints can never produce identical bytes.)
+    try:
+        if fname.stat().st_size == len(data) and fname.read_bytes() == data:
+            return
+    except OSError:
+        pass
+    if pool is not None:
+        futures.append(pool.submit(_write_bytes, fname, data))
+    else:
+        fname.write_bytes(data)
+
+def emit_postman(endpoints: List[Endpoint], base: str) -> Dict[str, Any]:
     items = []
-    for path, methods in (spec.get("paths") or {}).items():
-        for method, op in methods.items():
-            name = op.get("summary") or f"{method.upper()} {path}"
-            url = base + path
-            body_schema = body_schema_from_op(op)
-            body_example = example_payload(body_schema) if body_schema else None
-            item = {
-                "name": name,
-                "request": {
-                    "method": method.upper(),
-                    "header": [],
-                    "url": {"raw": url, "protocol": "http", "host": ["localhost"], "port": "8000", "path": path.lstrip("/").split("/")},
-                }
+    for rec in endpoints:
+        url = base + rec.path
+        item = {
+            "name": rec.name,
+            "request": {
+                "method": rec.method,
+                "header": [],
+                "url": {"raw": url, "protocol": "http", "host": ["localhost"], "port": "8000", "path": rec.path_segments},
+            }
+        }
+        if rec.body_example is not None:
+            item["request"]["body"] = {
+                "mode": "raw",
+                "raw": json.dumps(rec.body_example, indent=2),
+                "options": {"raw": {"language": "json"}}
             }
-            if body_example is not None:
-                item["request"]["body"] = {
-                    "mode": "raw",
-                    "raw": json.dumps(body_example, indent=2),
-                    "options": {"raw": {"language": "json"}}
-                }
-            items.append(item)
+        items.append(item)
     return {
         "info": {"name": "FastAPI Collection", "schema": "https://schema.getpostman.com/json/collection/v2.1.0/collection.json"},
         "item": items
     }
 
-def write_markdown(spec: Dict[str, Any], base: str):
-    parts = []
+def emit_csv(endpoints: List[Endpoint]):
+    with (OUT_DIR / "endpoints.csv").open("w", newline="", encoding="utf-8") as f:
+        cw = csv.writer(f)
+        cw.writerow(["method", "path", "operationId", "tags", "summary"])
+        for rec in endpoints:
+            cw.writerow([rec.method, rec.path, rec.op.get("operationId", ""), rec.tags, rec.summary])
+
+def emit_markdown(spec: Dict[str, Any], base: str, endpoints: List[Endpoint], cache: Dict[int, Any],
+                  pool: Optional[ThreadPoolExecutor] = None, futures: Optional[List] = None,
+                  example_hashes: Optional[Dict[str, str]] = None):
+    schemas = extract_schemas(spec)
+    buf = io.StringIO()
+    w = buf.write
+    def emit(s: str):
+        w(s)
+        w("\n\n")
     info = spec.get("info", {})
     title = info.get("title", "API Guide")
     version = info.get("version", "0.0.0")
-    parts.append(f"# {title}\n\n**Version:** {version}\n\n**Base URL:** `{base}`\n")
+    emit(f"# {title}\n\n**Version:** {version}\n\n**Base URL:** `{base}`\n")
 
     if "description" in info:
-        parts.append(info["description"])
+        emit(info["description"])
 
-    parts.append("## Quick Start\n\n```bash\ncurl -s " + base + "/health || true\n```")
+    emit("## Quick Start\n\n```bash\ncurl -s " + base + "/health || true\n```")
 
     # Security schemes
     components = spec.get("components", {})
     security_schemes = components.get("securitySchemes") or {}
     if security_schemes:
-        parts.append("## Authentication\n")
+        emit("## Authentication\n")
         for name, sch in security_schemes.items():
-            parts.append(f"- **{name}**: {sch.get('type','')} {sch.get('scheme','')}")
-        parts.append("Add `Authorization: Bearer <token>` where required.\n")
+            emit(f"- **{name}**: {sch.get('type','')} {sch.get('scheme','')}")
+        emit("Add `Authorization: Bearer <token>` where required.\n")
 
     # Endpoints
-    parts.append("## Endpoints\n")
-    paths = spec.get("paths") or {}
-    csv_lines = ["method,path,operationId,tags,summary"]
-    for path, methods in paths.items():
-        for method, op in methods.items():
-            opid = op.get("operationId", "")
-            tags = ", ".join(op.get("tags", []) or [])
-            summary = op.get("summary", "")
-            csv_lines.append(f"{method.upper()},{path},{opid},{tags},{summary}")
-
-            parts.append(f"### {method.upper()} `{path}`")
-            if summary:
-                parts.append(f"**Summary:** {summary}")
-            if tags:
-                parts.append(f"**Tags:** {tags}")
-            if op_security(op):
-                parts.append("> Requires authentication\n")
-
-            # Parameters
-            params = op.get("parameters") or []
-            if params:
-                parts.append("**Parameters**")
-                for p in params:
-                    loc = p.get("in", "")
-                    nm = p.get("name", "")
-                    req = p.get("required", False)
-                    schema = (p.get("schema") or {})
-                    typ = schema.get("type", "")
-                    dfl = schema.get("default", None)
-                    parts.append(f"- `{nm}` ({loc}) — {typ}; required: {req}; default: {dfl}")
-
-            # Request body
-            body_schema = body_schema_from_op(op)
-            if body_schema:
-                ex = example_payload(body_schema)
-                parts.append("**Request Body (JSON)**")
-                parts.append("```json\n" + json.dumps(ex, indent=2, ensure_ascii=False) + "\n```")
-
-            # Responses
-            parts.append("**Responses**")
-            for code, resp in (op.get("responses") or {}).items():
-                desc = (resp or {}).get("description", "")
-                parts.append(f"- **{code}**: {desc}")
-                content = (resp or {}).get("content") or {}
-                if "application/json" in content:
-                    sch = content["application/json"].get("schema")
-                    if sch:
-                        ex = example_payload(sch)
-                        if ex is not None:
-                            parts.append("```json\n" + json.dumps(ex, indent=2, ensure_ascii=False) + "\n```")
-
-            # Samples
-            write_endpoint_example(path, method.upper(), op, base)
-            parts.append(f"[Examples →](docs/examples/{sanitize_filename(method.upper())}_{sanitize_filename(path)}.md)")
-
-            parts.append("")
+    emit("## Endpoints\n")
+    for rec in endpoints:
+        path, mu, op = rec.path, rec.method, rec.op
+
+        emit(f"### {mu} `{path}`")
+        if rec.summary:
+            emit(f"**Summary:** {rec.summary}")
+        if rec.tags:
+            emit(f"**Tags:** {rec.tags}")
+        if rec.needs_auth:
+            emit("> Requires authentication\n")
+
+        # Parameters
+        params = op.get("parameters") or []
+        if params:
+            emit("**Parameters**")
+            for p in params:
+                loc = p.get("in", "")
+                nm = p.get("name", "")
+                req = p.get("required", False)
+                schema = (p.get("schema") or {})
+                typ = schema.get("type", "")
+                dfl = schema.get("default", None)
+                emit(f"- `{nm}` ({loc}) — {typ}; required: {req}; default: {dfl}")
+
+        # Request body
+        if rec.body_schema:
+            ex_json = _dumps(rec.body_example).decode("utf-8")
+            emit("**Request Body (JSON)**")
+            emit("```json\n" + ex_json + "\n```")
+
+        # Responses
+        emit("**Responses**")
+        for code, resp in (op.get("responses") or {}).items():
+            desc = (resp or {}).get("description", "")
+            emit(f"- **{code}**: {desc}")
+            content = (resp or {}).get("content") or {}
+            if "application/json" in content:
+                sch = content["application/json"].get("schema")
+                if sch:
+                    ex = example_payload(sch, cache, schemas=schemas)
+                    if ex is not None:
+                        ex_json = _dumps(ex).decode("utf-8")
+                        emit("```json\n" + ex_json + "\n```")
+
+        # Samples
+        write_endpoint_example(path, mu, rec.body_example, rec.needs_auth, base, pool, futures, example_hashes)
+        emit(f"[Examples →](docs/examples/{sanitize_filename(mu)}_{sanitize_filename(path)}.md)")
+
+        emit("")
 
     # Models/Schemas
-    schemas = extract_schemas(spec)
     if schemas:
-        parts.append("## Schemas\n")
+        emit("## Schemas\n")
         for name, sch in schemas.items():
-            save_json(sch, SCHEMAS_DIR / f"{sanitize_filename(name)}.json")
-            parts.append(f"### `{name}`")
+            save_json(sch, SCHEMAS_DIR / f"{sanitize_filename(name)}.json", pool, futures)
+            emit(f"### `{name}`")
             if "description" in sch:
-                parts.append(sch["description"])
-            ex = example_payload(sch)
+                emit(sch["description"])
+            ex = example_payload(sch, cache, schemas=schemas)
             if ex is not None:
-                parts.append("**Example**")
-                parts.append("```json\n" + json.dumps(ex, indent=2, ensure_ascii=False) + "\n```")
+                ex_json = _dumps(ex).decode("utf-8")
+                emit("**Example**")
+                emit("```json\n" + ex_json + "\n```")
 
-    (OUT_DIR / "endpoints.csv").write_text("\n".join(csv_lines), encoding="utf-8")
-    (ROOT / "API_GUIDE.md").write_text("\n\n".join(parts), encoding="utf-8")
+    (ROOT / "API_GUIDE.md").write_text(buf.getvalue(), encoding="utf-8")
 
-def validate_sample_endpoints(spec: Dict[str, Any], base: str, allow_destructive: bool = False) -> List[str]:
-    """
-    Make safe GET requests for a few endpoints (health, docs, etc.).
-    Avoid POST/PUT/PATCH/DELETE unless explicitly allowed.
-    """
-    import http.client, urllib.parse
-    logs = []
+async def _probe(host: str, port: int, method: str, path: str, timeout: float = 3.0) -> str:
+    """One raw HTTP/1.1 request over a fresh connection; returns a log line."""
+    async def _do() -> str:
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            req = f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n"
+            writer.write(req.encode("ascii"))
+            await writer.drain()
+            status_line = await reader.readline()
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+        parts = status_line.split(None, 2)
+        status = int(parts[1]) if len(parts) >= 2 else 0
+        return f"{method} {path} -> {status}"
+    try:
+        return await asyncio.wait_for(_do(), timeout)
+    except Exception as e:
+        return f"{method} {path} -> ERROR {e}"
+
+async def _read_response(reader) -> int:
+    """Consume one HTTP/1.1 response (headers + body) and return its status."""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("connection closed mid-pipeline")
+    parts = status_line.split(None, 2)
+    status = int(parts[1]) if len(parts) >= 2 else 0
+    length = 0
+    chunked = False
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        key, _, val = line.partition(b":")
+        key = key.strip().lower()
+        if key == b"content-length":
+            length = int(val.strip())
+        elif key == b"transfer-encoding" and b"chunked" in val.lower():
+            chunked = True
+    if chunked:
+        while True:
+            size_line = await reader.readline()
+            size = int(size_line.split(b";")[0].strip() or b"0", 16)
+            if size == 0:
+                await reader.readline()  # trailing CRLF
+                break
+            await reader.readexactly(size + 2)
+    elif length:
+        await reader.readexactly(length)
+    return status
+
+async def _probe_pipelined(host: str, port: int, test_paths: List[Tuple[str, str]]) -> List[str]:
+    """Send every probe on one keep-alive connection in a single batched
+    write, then parse the responses in order: one round-trip instead of
+    one per path."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        batch = b"".join(
+            f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nConnection: keep-alive\r\n\r\n".encode("ascii")
+            for method, path in test_paths
+        )
+        writer.write(batch)
+        await writer.drain()
+        logs = []
+        for method, path in test_paths:
+            status = await _read_response(reader)
+            logs.append(f"{method} {path} -> {status}")
+        return logs
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+
+def pick_probe_targets(endpoints: List[Endpoint]) -> List[Tuple[str, str]]:
     test_paths = []
-    paths = spec.get("paths") or {}
     # Pick a few "safe" candidates
-    for p, methods in paths.items():
-        if "get" in methods and any(seg in p for seg in ["/health", "/live", "/ready", "/docs", "/openapi.json"]):
-            test_paths.append(("GET", p))
+    for rec in endpoints:
+        if rec.method == "GET" and any(seg in rec.path for seg in ["/health", "/live", "/ready", "/docs", "/openapi.json"]):
+            test_paths.append(("GET", rec.path))
     # Fallback: first 3 GET endpoints
     if not test_paths:
-        for p, methods in list(paths.items())[:10]:
-            if "get" in methods:
-                test_paths.append(("GET", p))
+        for rec in endpoints[:10]:
+            if rec.method == "GET":
+                test_paths.append(("GET", rec.path))
                 if len(test_paths) >= 3:
                     break
+    return test_paths
+
+def validate_sample_endpoints(endpoints: List[Endpoint], base: str, allow_destructive: bool = False) -> List[str]:
+    """
+    Make safe GET requests for a few endpoints (health, docs, etc.).
+    Avoid POST/PUT/PATCH/DELETE unless explicitly allowed.
+    Probes run concurrently so total wall time is max(latency), not sum.
+    """
+    import urllib.parse
+    test_paths = pick_probe_targets(endpoints)
 
     parsed = urllib.parse.urlparse(base)
-    conn = http.client.HTTPConnection(parsed.hostname, parsed.port or 80, timeout=3)
-    for method, path in test_paths:
+    host = parsed.hostname or "localhost"
+    port = parsed.port or 80
+
+    async def _run() -> List[str]:
         try:
-            conn.request(method, path)
-            resp = conn.getresponse()
-            logs.append(f"{method} {path} -> {resp.status}")
-            resp.read()
-        except Exception as e:
-            logs.append(f"{method} {path} -> ERROR {e}")
-    conn.close()
-    return logs
+            return await asyncio.wait_for(
+                _probe_pipelined(host, port, test_paths), 3.0 * max(len(test_paths), 1)
+            )
+        except Exception:
+            # Server didn't tolerate pipelining (or closed early); fall
+            # back to concurrent per-path probes. gather preserves
+            # submission order, so logs stay stable.
+            return list(await asyncio.gather(
+                *[_probe(host, port, method, path) for method, path in test_paths]
+            ))
+
+    return asyncio.run(_run())
 
 def main():
     parser = argparse.ArgumentParser()
@@ -402,9 +721,11 @@ def main():
 
     _mkdirs()
     report = []
+    meta = _load_cache_meta()
 
     # Select source
     spec = None
+    raw = None
     order = {
         "live": ["live", "import", "static"],
         "import": ["import", "live", "static"],
@@ -413,7 +734,7 @@ def main():
 
     for mode in order:
         if mode == "live":
-            spec = fetch_live_openapi(args.openapi_url)
+            spec, raw = fetch_live_openapi(args.openapi_url, meta)
             if spec:
                 report.append(f"OpenAPI source: LIVE ({args.openapi_url})")
                 break
@@ -431,20 +752,69 @@ def main():
         print("ERROR: Could not obtain OpenAPI spec from any source.", file=sys.stderr)
         sys.exit(2)
 
-    save_json(spec, OUT_DIR / "openapi.snapshot.json")
-
+    if raw is None:
+        # Spec came from import/static, so the snapshot we are about to
+        # write is not the server's; stale validators would 304 against
+        # it on the next run and pin the docs to this fallback forever.
+        meta.pop("etag", None)
+        meta.pop("last_modified", None)
+        meta.pop("live_digest", None)
+
+    # Reuse the wire bytes for the snapshot when we have them; only the
+    # import/static paths pay for a re-encode.
+    spec_bytes = raw if raw is not None else _dumps(spec)
+    digest = hashlib.blake2b(spec_bytes).hexdigest()
+    outputs = [
+        ROOT / "API_GUIDE.md",
+        SNAPSHOT_PATH,
+        OUT_DIR / "postman_collection.json",
+        OUT_DIR / "endpoints.csv",
+    ]
     base = base_url_from_openapi(spec)
-    write_markdown(spec, base)
+
+    if digest == meta.get("digest") and all(p.exists() for p in outputs):
+        # Generation can be skipped, but an explicit validation request
+        # still runs (and refreshes the report) on the shortcut path.
+        if args.validate == "sample":
+            endpoints, _ = collect_endpoints(spec)
+            logs = validate_sample_endpoints(endpoints, base, args.allow_destructive)
+            report.extend(["Validation:", *logs])
+            (OUT_DIR / "report.txt").write_text("\n".join(report), encoding="utf-8")
+        print("OK: OpenAPI spec unchanged; skipping regeneration.")
+        return
+
+    # Overlap output writes with generation; outputs never read each other.
+    pool = ThreadPoolExecutor(max_workers=8)
+    futures: List = []
+    futures.append(pool.submit(_write_bytes, SNAPSHOT_PATH, spec_bytes))
+
+    endpoints, cache = collect_endpoints(spec)
+    example_hashes = _load_example_hashes()
+    emit_markdown(spec, base, endpoints, cache, pool, futures, example_hashes)
+    emit_csv(endpoints)
 
     # Postman
-    postman = generate_postman(spec, base)
-    save_json(postman, OUT_DIR / "postman_collection.json")
+    postman = emit_postman(endpoints, base)
+    save_json(postman, OUT_DIR / "postman_collection.json", pool, futures)
 
     # Validation
     if args.validate == "sample":
-        logs = validate_sample_endpoints(spec, base, args.allow_destructive)
+        logs = validate_sample_endpoints(endpoints, base, args.allow_destructive)
         report.extend(["Validation:", *logs])
 
+    futures_wait(futures)
+    pool.shutdown()
+    # Surface write failures before recording success; otherwise the
+    # hash map and cache digest would mark never-written files as done.
+    for f in futures:
+        f.result()
+
+    EXAMPLE_HASHES_PATH.write_text(json.dumps(example_hashes, indent=2), encoding="utf-8")
+
+    meta["digest"] = digest
+    meta["mtime"] = time.time()
+    _save_cache_meta(meta)
+
     (OUT_DIR / "report.txt").write_text("\n".join(report), encoding="utf-8")
     print("OK: API_GUIDE.md and docs/ generated.")
 